@@ -17,28 +17,71 @@ Beccar, Buenos Aires, Argentina
 import os
 import sys
 import json
+import time
+import shlex
+import queue
+import itertools
 import curses
+import curses.panel
 import threading
 import subprocess
-from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import signal
 
+# Serialización JSON: orjson si está disponible (3-5x más rápido),
+# json de la stdlib como fallback
 try:
-    import os
-    import sys
-    import json
-    import signal
-    import curses
-    import threading
-    import netCDF4 as nc
-    import numpy as np
-    import pandas as pd
-except ImportError as e:
-    print(f"Error: Faltan dependencias requeridas. Instala con:")
-    print("pip install netCDF4 numpy pandas")
-    sys.exit(1)
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4, ensure_ascii=False)
+
+# Las dependencias científicas se importan bajo demanda: pandas solo se usa
+# al exportar y netCDF4/numpy recién en el análisis, así el arranque de la
+# interfaz no paga cientos de ms de import.
+nc = None
+
+def _require_nc():
+    """Importa netCDF4 la primera vez que hace falta
+
+    Lanza ImportError con la pista de instalación: el que llama decide
+    cómo mostrarla (un sys.exit acá mataría la interfaz ya iniciada y el
+    mensaje se perdería al restaurar el terminal).
+    """
+    global nc
+    if nc is None:
+        try:
+            import netCDF4
+        except ImportError as e:
+            raise ImportError(
+                "Falta netCDF4 (instala con: pip install netCDF4 numpy pandas)"
+            ) from e
+        nc = netCDF4
+    return nc
+
+def _require_np():
+    """Importa numpy la primera vez que hace falta"""
+    import numpy
+    return numpy
+
+def _require_pd():
+    """Importa pandas la primera vez que hace falta (exportación)"""
+    import pandas
+    return pandas
 
 class NetCDFConfig:
     """Clase para manejar la configuración del script"""
@@ -75,13 +118,26 @@ class NetCDFConfig:
             }
         }
         self.config = self.load_config()
-    
+
+        # Comando de montaje ya tokenizado: se ejecuta sin pasar por el shell
+        mount_command = self.config.get("windows_paths", {}).get("mount_command", "")
+        self.mount_argv = shlex.split(mount_command)
+
+    # Configuraciones ya parseadas, por archivo: (mtime, dict)
+    _parsed_cache: Dict[str, Tuple[float, Dict]] = {}
+
     def load_config(self) -> Dict:
-        """Carga la configuración desde archivo JSON"""
+        """Carga la configuración desde archivo JSON (cacheada por mtime)"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                mtime = os.path.getmtime(self.config_file)
+                cached = NetCDFConfig._parsed_cache.get(self.config_file)
+                if cached is not None and cached[0] == mtime:
+                    config = cached[1]
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        config = _json_loads(f.read())
+                    NetCDFConfig._parsed_cache[self.config_file] = (mtime, config)
                 merged_config = self.default_config.copy()
                 merged_config.update(config)
                 return merged_config
@@ -90,117 +146,188 @@ class NetCDFConfig:
         else:
             self.save_config(self.default_config)
             return self.default_config
-    
+
     def save_config(self, config: Dict = None) -> None:
         """Guarda la configuración en archivo JSON"""
         config = config or self.config
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+                f.write(_json_dumps(config))
         except Exception:
             pass
 
 class FileItem:
-    """Representa un elemento del sistema de archivos"""
-    def __init__(self, path: str, name: str = None):
+    """Representa un elemento del sistema de archivos
+
+    El camino rápido es from_direntry (sin syscalls extra); el constructor
+    por path queda como camino lento para pseudo-entradas como "..".
+    """
+    def __init__(self, path: str, name: str = None, is_dir: bool = None):
         self.path = path
         self.name = name or os.path.basename(path)
-        self.is_dir = os.path.isdir(path)
-        self.is_nc = path.lower().endswith('.nc') if not self.is_dir else False
+        self.is_dir = os.path.isdir(path) if is_dir is None else is_dir
+        # Solo se baja a minúsculas el sufijo de 3 caracteres, no el path entero
+        self.is_nc = not self.is_dir and self.name[-3:].lower() == '.nc'
         self.size = self._get_size()
         self.modified = self._get_modified()
-    
+        self._formatted_size = None
+
+    @classmethod
+    def from_direntry(cls, entry: os.DirEntry) -> 'FileItem':
+        """Crea un FileItem desde os.DirEntry reutilizando el stat cacheado"""
+        item = cls.__new__(cls)
+        item.path = entry.path
+        item.name = entry.name
+        item.is_dir = entry.is_dir(follow_symlinks=False)
+        item.is_nc = not item.is_dir and entry.name[-3:].lower() == '.nc'
+        try:
+            st = entry.stat(follow_symlinks=False)
+            item.size = 0 if item.is_dir else st.st_size
+            item.modified = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
+        except:
+            item.size = 0
+            item.modified = "N/A"
+        item._formatted_size = None
+        return item
+
     def _get_size(self) -> int:
         try:
             return os.path.getsize(self.path) if not self.is_dir else 0
         except:
             return 0
-    
+
     def _get_modified(self) -> str:
         try:
             timestamp = os.path.getmtime(self.path)
             return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
         except:
             return "N/A"
-    
+
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
     def format_size(self) -> str:
-        """Formatea el tamaño del archivo"""
-        if self.is_dir:
-            return "<DIR>"
-        
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+        """Formatea el tamaño del archivo (cacheado por item)"""
+        if self._formatted_size is None:
+            if self.is_dir:
+                self._formatted_size = "<DIR>"
+            else:
+                # Selección de unidad sin bucle: cada unidad cubre 10 bits
+                shift = min((max(self.size, 1).bit_length() - 1) // 10, 4)
+                self._formatted_size = f"{self.size / (1 << (10 * shift)):.1f}{self._SIZE_UNITS[shift]}"
+        return self._formatted_size
 
 class Panel:
     """Panel de archivos estilo Norton Commander"""
     def __init__(self, x: int, y: int, width: int, height: int, path: str = None):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
         self.current_path = path or os.getcwd()
         self.items: List[FileItem] = []
         self.selected_index = 0
         self.scroll_offset = 0
         self.is_active = False
+        self.resize(x, y, width, height)
+        self.ui_events: Optional[queue.Queue] = None
+        self.io_pool: Optional[ThreadPoolExecutor] = None
+        self._loading = False
+        self.title_prefix = ""
+        self._update_title()
         self.refresh_items()
-    
-    def refresh_items(self):
-        """Actualiza la lista de archivos del directorio actual"""
+
+    def resize(self, x: int, y: int, width: int, height: int):
+        """Actualiza la geometría del panel sin tocar listado ni selección"""
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        # Formato de fila precomputado: ancho y precisión fuerzan relleno y
+        # truncado en una sola operación (largo exacto: width - 2)
+        self._name_w = width - 12
+        self._trunc_w = width - 15
+        self._row_fmt = " {:<%d.%d} {:>8}" % (self._name_w, self._name_w)
+        self._border_top = "┌" + "─" * (width - 2) + "┐"
+        self._border_bottom = "└" + "─" * (width - 2) + "┘"
+        self._blank_row = " " * (width - 2)
+        # Mantener la selección visible con la nueva altura
+        visible_items = height - 3  # Espacio para bordes y header
+        if self.selected_index >= self.scroll_offset + visible_items:
+            self.scroll_offset = max(0, self.selected_index - visible_items + 1)
+
+    def _update_title(self):
+        """Recalcula el título del panel (solo cambia al navegar)"""
+        self._basename = os.path.basename(self.current_path) or self.current_path
+        if self.title_prefix:
+            self._title = f"{self.title_prefix} - {self._basename}"
+        else:
+            self._title = self._basename
+
+    def _scan_items(self) -> List[FileItem]:
+        """Construye la lista de archivos del directorio actual"""
+        items = []
         try:
-            self.items = []
-            
             # Añadir directorio padre si no estamos en root
             if self.current_path != '/':
                 parent_path = os.path.dirname(self.current_path)
-                self.items.append(FileItem(parent_path, ".."))
-            
-            # Listar archivos y directorios
+                items.append(FileItem(parent_path, "..", is_dir=True))
+
+            # Listar archivos y directorios con un solo stat por entrada
             try:
-                entries = os.listdir(self.current_path)
-                entries.sort()
-                
-                # Primero directorios, luego archivos
-                dirs = []
-                files = []
-                
-                for entry in entries:
-                    if entry.startswith('.'):
-                        continue  # Omitir archivos ocultos por ahora
-                    
-                    full_path = os.path.join(self.current_path, entry)
-                    item = FileItem(full_path, entry)
-                    
-                    if item.is_dir:
-                        dirs.append(item)
-                    else:
-                        files.append(item)
-                
-                self.items.extend(dirs)
-                self.items.extend(files)
-                
+                with os.scandir(self.current_path) as it:
+                    # Omitir archivos ocultos por ahora
+                    entries = [FileItem.from_direntry(e) for e in it
+                               if not e.name.startswith('.')]
+
+                # Una sola pasada de sort sobre el bit is_dir ya resuelto:
+                # directorios primero, luego por nombre sin distinguir mayúsculas
+                entries.sort(key=lambda item: (not item.is_dir, item.name.lower()))
+
+                items.extend(entries)
+
             except PermissionError:
                 pass
-            
-            # Ajustar índice seleccionado
-            if self.selected_index >= len(self.items):
-                self.selected_index = max(0, len(self.items) - 1)
-                
+
         except Exception:
-            self.items = []
-    
+            return []
+
+        return items
+
+    def refresh_items(self):
+        """Actualiza la lista de archivos del directorio actual (síncrono)"""
+        self.items = self._scan_items()
+
+        # Ajustar índice seleccionado
+        if self.selected_index >= len(self.items):
+            self.selected_index = max(0, len(self.items) - 1)
+
+    def schedule_refresh(self):
+        """Refresca el panel en segundo plano para no bloquear la interfaz
+
+        En montajes de red lentos (CIFS) el escaneo puede tardar segundos;
+        el resultado llega por la cola de eventos de la interfaz.
+        """
+        if self.ui_events is None:
+            self.refresh_items()
+            return
+
+        self._loading = True
+        if self.io_pool is not None:
+            self.io_pool.submit(self._refresh_worker)
+        else:
+            thread = threading.Thread(target=self._refresh_worker, daemon=True)
+            thread.start()
+
+    def _refresh_worker(self):
+        """Worker de escaneo: corre fuera del hilo de la interfaz"""
+        items = self._scan_items()
+        self.ui_events.put(('panel_items', self, items))
+
     def navigate_to(self, path: str):
         """Navega a un directorio específico"""
         if os.path.isdir(path):
             self.current_path = os.path.abspath(path)
             self.selected_index = 0
             self.scroll_offset = 0
-            self.refresh_items()
-    
+            self._update_title()
+            self.schedule_refresh()
+
     def get_selected_item(self) -> Optional[FileItem]:
         """Obtiene el elemento seleccionado actualmente"""
         if 0 <= self.selected_index < len(self.items):
@@ -233,79 +360,373 @@ class Panel:
                 return selected
         return None
 
+class _NCHandlePool:
+    """Pool LRU de Datasets NetCDF abiertos
+
+    Abrir un archivo netCDF-4/HDF5 carga todos sus metadatos de forma
+    ansiosa; reutilizar el handle abierto evita repagar ese costo en cada
+    vista previa del mismo archivo.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._handles = OrderedDict()  # path -> (Dataset, mtime_ns)
+
+    def acquire(self, path: str, mtime_ns: int):
+        """Devuelve un Dataset abierto para path, reutilizando si sigue vigente"""
+        cached = self._handles.get(path)
+        if cached is not None:
+            dataset, cached_mtime = cached
+            if cached_mtime == mtime_ns:
+                self._handles.move_to_end(path)
+                return dataset
+            # El archivo cambió en disco: cerrar el handle viejo
+            del self._handles[path]
+            try:
+                dataset.close()
+            except Exception:
+                pass
+
+        dataset = _require_nc().Dataset(path, 'r')
+        self._handles[path] = (dataset, mtime_ns)
+        if len(self._handles) > self.maxsize:
+            _, (oldest, _mtime) = self._handles.popitem(last=False)
+            try:
+                oldest.close()
+            except Exception:
+                pass
+        return dataset
+
+    def close_all(self):
+        """Cierra todos los Datasets abiertos del pool"""
+        while self._handles:
+            _, (dataset, _mtime) = self._handles.popitem(last=False)
+            try:
+                dataset.close()
+            except Exception:
+                pass
+
+_nc_pool = _NCHandlePool()
+
+@lru_cache(maxsize=256)
+def _analyze_nc(file_path: str, mtime_ns: int, size: int) -> Dict:
+    """Lee los metadatos de un archivo NetCDF (cacheado por path/mtime/tamaño)"""
+    try:
+        dataset = _nc_pool.acquire(file_path, mtime_ns)
+        # Solo metadatos escalares: nombres y largos, sin materializar
+        # objetos Dimension/Variable completos
+        return {
+            "dimensions": {name: len(dataset.dimensions[name])
+                           for name in itertools.islice(dataset.dimensions, 5)},  # Primeras 5
+            "variables": list(itertools.islice(dataset.variables, 10)),  # Primeras 10
+            "global_attrs": {key: dataset.getncattr(key)
+                             for key in itertools.islice(dataset.ncattrs(), 5)},  # Primeros 5
+            "file_size": size
+        }
+    except ImportError as e:
+        return {"error": str(e)}
+    except Exception:
+        return {"error": "No se pudo leer el archivo NetCDF"}
+
+@lru_cache(maxsize=128)
+def _format_preview_lines(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Renderiza las líneas de la vista previa (cacheadas junto a los metadatos)
+
+    Volver a visitar un archivo ya mostrado es un lookup: ni se reabre el
+    .nc ni se reformatea el texto.
+    """
+    info = _analyze_nc(file_path, mtime_ns, size)
+    if "error" in info:
+        return ()
+
+    lines = []
+
+    # Información del archivo
+    if "file_size" in info:
+        fsize = info["file_size"]
+        size_str = f"{fsize/1024/1024:.1f} MB" if fsize > 1024*1024 else f"{fsize/1024:.1f} KB"
+        lines.append(f"Tamaño: {size_str}")
+
+    # Dimensiones (largos ya resueltos a int en el análisis)
+    if "dimensions" in info:
+        lines.append("Dimensiones:")
+        for name, dim_len in info["dimensions"].items():
+            lines.append(f"  {name}: ({dim_len} elementos)")
+
+    # Variables
+    if "variables" in info:
+        lines.append("Variables:")
+        for var in info["variables"]:
+            lines.append(f"  {var}")
+
+    # Atributos globales
+    if "global_attrs" in info:
+        lines.append("Atributos:")
+        for key, value in info["global_attrs"].items():
+            value_str = str(value)[:30] + "..." if len(str(value)) > 30 else str(value)
+            lines.append(f"  {key}: {value_str}")
+
+    return tuple(lines)
+
 class NCPreview:
     """Panel de vista previa para archivos NetCDF"""
     def __init__(self, x: int, y: int, width: int, height: int):
+        self.current_file = None
+        self.nc_info = {}
+        self.lines: Tuple[str, ...] = ()
+        self.resize(x, y, width, height)
+
+    def resize(self, x: int, y: int, width: int, height: int):
+        """Actualiza la geometría sin descartar el análisis ya mostrado"""
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self.current_file = None
-        self.nc_info = {}
-    
+        self._border_top = "┌" + "─" * (width - 2) + "┐"
+        self._border_bottom = "└" + "─" * (width - 2) + "┘"
+        self._blank_row = " " * (width - 2)
+
     def analyze_file(self, file_path: str):
         """Analiza un archivo NetCDF y guarda la información"""
-        if not file_path.lower().endswith('.nc'):
+        if file_path[-3:].lower() != '.nc':
             self.nc_info = {}
+            self.lines = ()
             self.current_file = file_path
             return
-        
+
         try:
-            with nc.Dataset(file_path, 'r') as dataset:
-                self.nc_info = {
-                    "dimensions": dict(dataset.dimensions.items()),
-                    "variables": list(dataset.variables.keys())[:10],  # Primeras 10
-                    "global_attrs": dict(list(dataset.__dict__.items())[:5]),  # Primeros 5
-                    "file_size": os.path.getsize(file_path)
-                }
-                self.current_file = file_path
-        except Exception:
+            st = os.stat(file_path)
+        except OSError:
             self.nc_info = {"error": "No se pudo leer el archivo NetCDF"}
+            self.lines = ()
             self.current_file = file_path
+            return
+
+        # Un solo stat: mtime/tamaño en la clave invalidan el cache si el archivo cambia
+        self.nc_info = _analyze_nc(file_path, st.st_mtime_ns, st.st_size)
+        self.lines = _format_preview_lines(file_path, st.st_mtime_ns, st.st_size)
+        self.current_file = file_path
+
+    def clear_cache(self):
+        """Descarta los metadatos cacheados (para F5/refresco manual)"""
+        _analyze_nc.cache_clear()
+        _format_preview_lines.cache_clear()
 
 class StatusBar:
     """Barra de estado inferior"""
     def __init__(self, x: int, y: int, width: int):
+        self.message = "Listo"
+        self.help_text = "F1:Ayuda F2:Analizar F3:Extraer F4:Exportar F10:Salir"
+        self.resize(x, y, width)
+
+    def resize(self, x: int, y: int, width: int):
+        """Actualiza la geometría de la barra"""
         self.x = x
         self.y = y
         self.width = width
-        self.message = "Listo"
-        self.help_text = "F1:Ayuda F2:Analizar F3:Extraer F4:Exportar F10:Salir"
     
     def set_message(self, message: str):
         """Establece el mensaje de estado"""
         self.message = message[:self.width - 20]  # Truncar si es muy largo
 
+# Estilo por categoría de línea de ayuda: (par de color, atributos, centrada)
+_HELP_CATEGORY_STYLE = {
+    'title': (10, curses.A_BOLD, True),
+    'developer': (9, 0, True),
+    'section': (4, curses.A_BOLD, False),
+    'contact': (9, 0, False),
+    'footer': (3, curses.A_BLINK, True),
+    'body': (6, 0, False),
+}
+
 class NCInterface:
     """Interfaz principal tipo Norton Commander"""
     
-    def __init__(self, config: NetCDFConfig):
+    def __init__(self, config: NetCDFConfig, screen=None):
         self.config = config
-        self.screen = None
+        self.screen = screen
         self.running = True
+
+        # Valores de configuración aplanados (evita recorrer dicts por frame)
+        self._cache_config()
+
+        # Líneas de la ayuda precompiladas con su estilo
+        self._help_render = self._build_help_render()
+
+        # Ventana/panel de ayuda reutilizados entre pulsaciones de F1
+        # (se invalidan en _handle_resize)
+        self._help_win = None
+        self._help_panel = None
+        self._help_layout = []
+
+        # Despacho de teclas O(1) en lugar de la escalera de elif.
+        # get_wch devuelve str para teclas imprimibles/ESC e int para KEY_*
+        self._quit_keys = frozenset({curses.KEY_F10, 'q', '\x1b'})
+        self._key_handlers = {
+            curses.KEY_UP: self._on_key_up,
+            curses.KEY_DOWN: self._on_key_down,
+            '\t': self._on_switch_panel,
+            curses.KEY_RIGHT: self._on_switch_panel,
+            curses.KEY_LEFT: self._on_focus_left,
+            '\n': self._on_enter,
+            curses.KEY_ENTER: self._on_enter,
+            curses.KEY_F1: self.show_help,
+            curses.KEY_F2: self.handle_f2_analyze,
+            curses.KEY_F4: self.handle_f4_export,
+            curses.KEY_F5: self.handle_f5_mount,
+        }
         
         # Componentes de la interfaz
         self.left_panel = None
         self.right_panel = None
         self.preview_panel = None
         self.status_bar = None
-        self.active_panel = 'left'
+        # Referencia directa al panel activo: evita el ternario
+        # left/right en cada pulsación (se asigna en setup_panels)
+        self._active_panel_ref = None
         
         # Estado de la aplicación
         self.mount_status = False
         self.last_operation = ""
+
+        # Debounce de la vista previa (no abrir .nc en cada pulsación)
+        self._preview_pending = False
+        self._preview_deadline = 0.0
+        self._preview_key = None  # (panel activo, paths, índices) ya mostrados
+
+        # Regiones pendientes de redibujar (evita limpiar toda la pantalla)
+        self._dirty = {'left': True, 'right': True, 'preview': True,
+                       'header': True, 'status': True}
+
+        # Eventos producidos por hilos de fondo (refrescos de panel, etc.)
+        self._ui_events = queue.Queue()
+
+        # Pool persistente para todo el I/O bloqueante (en vez de un
+        # threading.Thread nuevo por operación)
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nc-io")
         
-        # Setup signal handlers
+        # Tamaño de terminal cacheado (solo cambia con KEY_RESIZE)
+        self._term_h = 0
+        self._term_w = 0
+
+        # Setup signal handlers (SIGWINCH queda en manos de ncurses, que
+        # llama a resizeterm y encola KEY_RESIZE; reemplazarlo dejaría
+        # getmaxyx con el tamaño viejo)
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
+    def _cache_config(self):
+        """Aplana los valores de configuración usados en el dibujo
+
+        Volver a llamar tras recargar la configuración.
+        """
+        cfg = self.config.config
+        self._app_info = cfg.get("app_info", {})
+        self._app_name = self._app_info.get("name", "NetCDF Commander")
+        self._version = self._app_info.get("version", "1.0.0")
+        self._developer = self._app_info.get("developer", "Papiweb Desarrollos Informáticos")
+        self._app_email = self._app_info.get("email", "mgenialive@gmail.com")
+        self._app_web = self._app_info.get("website", "https://www.papiweb-desarrollos.github.io/papiweb")
+        self._app_location = self._app_info.get("location", "Beccar, Buenos Aires, Argentina")
+        self._mount_point = cfg.get("windows_mount_point", "/tmp")
+        self._show_splash = cfg.get("interface", {}).get("show_splash", True)
+
+    @property
+    def active_panel(self) -> str:
+        """Lado activo como cadena ('left'/'right'), derivado de la referencia"""
+        if self.right_panel is not None and self._active_panel_ref is self.right_panel:
+            return 'right'
+        return 'left'
+
+    def _build_help_render(self) -> List[Tuple[str, int, int, bool]]:
+        """Precompila las líneas de ayuda como (texto, par, atributos, centrada)
+
+        La clasificación por contenido corre una sola vez acá en lugar de
+        en cada pulsación de F1.
+        """
+        # Categoría explícita por línea: nada de buscar emojis por substring
+        help_lines = [
+            ('title', f" {self._app_name} - AYUDA "),
+            ('developer', f" {self._developer} "),
+            ('body', "═" * 66),
+            ('body', ""),
+            ('section', "🎯 NAVEGACIÓN:"),
+            ('body', "  ↑/↓        - Mover selección en panel activo"),
+            ('body', "  ←/→/Tab    - Cambiar entre paneles"),
+            ('body', "  Enter      - Entrar en directorio o seleccionar archivo"),
+            ('body', ""),
+            ('section', "⚡ TECLAS DE FUNCIÓN:"),
+            ('body', "  F1         - Mostrar esta ayuda"),
+            ('body', "  F2         - Analizar archivo NetCDF seleccionado"),
+            ('body', "  F3         - Ver detalles del archivo"),
+            ('body', "  F4         - Exportar datos a CSV/JSON/TXT"),
+            ('body', "  F5         - Montar/desmontar recurso Windows"),
+            ('body', "  F6         - Copiar archivo entre paneles"),
+            ('body', "  F9         - Configuración del sistema"),
+            ('body', "  F10/Q/Esc  - Salir de la aplicación"),
+            ('body', ""),
+            ('section', "📊 FUNCIONES NetCDF:"),
+            ('body', "  • Vista previa automática de metadatos"),
+            ('body', "  • Análisis de dimensiones y variables"),
+            ('body', "  • Exportación a múltiples formatos"),
+            ('body', ""),
+            ('contact', f"📧 Soporte: {self._app_email}"),
+            ('contact', f"🌍 Web: {self._app_web}"),
+            ('body', ""),
+            ('footer', "        ⌨️  Presiona cualquier tecla para continuar  ⌨️"),
+        ]
+
+        return [(line,) + _HELP_CATEGORY_STYLE[category]
+                for category, line in help_lines]
+
+    def _shutdown_io_pool(self):
+        """Apaga el pool de I/O sin esperar los trabajos en vuelo"""
+        try:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            self._io_pool.shutdown(wait=False)  # Python < 3.9 sin cancel_futures
+
     def _signal_handler(self, signum, frame):
         """Maneja señales del sistema"""
         self.running = False
+        self._shutdown_io_pool()
+        _nc_pool.close_all()
         if self.screen:
             curses.endwin()
         sys.exit(0)
     
+    def _handle_resize(self):
+        """Recalcula la geometría tras un cambio de tamaño de terminal
+
+        Los paneles se redimensionan en el lugar: conservan listado,
+        selección y scroll, y no se vuelve a escanear disco en el hilo
+        de la interfaz.
+        """
+        self._term_h, self._term_w = self.screen.getmaxyx()
+        height, width = self._term_h, self._term_w
+
+        panel_width = width // 3
+        self.left_panel.resize(0, 1, panel_width, height - 3)
+        self.right_panel.resize(panel_width + 1, 1, panel_width, height - 3)
+
+        preview_width = width - (2 * panel_width) - 2
+        self.preview_panel.resize(2 * panel_width + 2, 1, preview_width, height - 3)
+
+        self.status_bar.resize(0, height - 1, width)
+
+        # La geometría de la ayuda depende del tamaño del terminal
+        self._help_win = None
+        self._help_panel = None
+        self._help_layout = []
+
+        # Invalidar la clave de la vista previa: con la clave vieja el
+        # debounce descartaría el refresco como "ya mostrado"
+        self._preview_key = None
+        self.update_preview()
+
+        self.screen.erase()
+        self._mark_dirty('left', 'right', 'preview', 'header', 'status')
+
     def init_colors(self):
         """Inicializa los colores de la interfaz"""
         curses.start_color()
@@ -322,20 +743,51 @@ class NCInterface:
         curses.init_pair(8, curses.COLOR_MAGENTA, curses.COLOR_BLACK) # Directorio
         curses.init_pair(9, curses.COLOR_CYAN, curses.COLOR_BLUE)     # Branding
         curses.init_pair(10, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Título
+
+        # Palabras de atributo precalculadas: color_pair es una llamada C
+        # que no hace falta repetir en cada fila de cada frame
+        self._attr_active = curses.color_pair(1)
+        self._attr_inactive = curses.color_pair(2)
+        self._attr_selected = curses.color_pair(3) | curses.A_REVERSE
+        self._attr_loading = curses.color_pair(3)
+        self._attr_nc = curses.color_pair(4)
+        self._attr_error = curses.color_pair(5)
+        self._attr_normal = curses.color_pair(6)
+        self._attr_status = curses.color_pair(7)
+        self._attr_dir = curses.color_pair(8)
+        self._attr_brand = curses.color_pair(9)
+        self._attr_header_title = curses.color_pair(10) | curses.A_BOLD
     
     def setup_panels(self):
         """Configura los paneles de la interfaz"""
-        height, width = self.screen.getmaxyx()
-        
+        self._term_h, self._term_w = self.screen.getmaxyx()
+        height, width = self._term_h, self._term_w
+
         # Panel izquierdo
         panel_width = width // 3
         self.left_panel = Panel(0, 1, panel_width, height - 3)
-        self.left_panel.is_active = True
-        
+
         # Panel derecho
-        self.right_panel = Panel(panel_width + 1, 1, panel_width, height - 3, 
-                               self.config.config.get('windows_mount_point', '/tmp'))
-        
+        self.right_panel = Panel(panel_width + 1, 1, panel_width, height - 3,
+                               self._mount_point)
+
+        self._active_panel_ref = self.left_panel
+        self.left_panel.is_active = True
+        self.right_panel.is_active = False
+
+        # Los paneles publican sus refrescos de fondo en la cola de la interfaz
+        # y comparten el pool de I/O
+        self.left_panel.ui_events = self._ui_events
+        self.left_panel.io_pool = self._io_pool
+        self.right_panel.ui_events = self._ui_events
+        self.right_panel.io_pool = self._io_pool
+
+        # Títulos cacheados (se recalculan solo al navegar)
+        self.left_panel.title_prefix = "Panel Izq"
+        self.left_panel._update_title()
+        self.right_panel.title_prefix = "Panel Der"
+        self.right_panel._update_title()
+
         # Panel de vista previa
         preview_width = width - (2 * panel_width) - 2
         self.preview_panel = NCPreview(2 * panel_width + 2, 1, preview_width, height - 3)
@@ -345,88 +797,123 @@ class NCInterface:
     
     def draw_panel_border(self, panel: Panel, title: str):
         """Dibuja el borde y título de un panel"""
-        color = curses.color_pair(1) if panel.is_active else curses.color_pair(2)
-        
-        # Borde superior
-        self.screen.addstr(panel.y - 1, panel.x, "┌" + "─" * (panel.width - 2) + "┐", color)
-        
+        color = self._attr_active if panel.is_active else self._attr_inactive
+
+        # Borde superior (línea precomputada, un solo addstr)
+        self.screen.addstr(panel.y - 1, panel.x, panel._border_top, color)
+
         # Título
         title_text = f" {title} "
         title_x = panel.x + (panel.width - len(title_text)) // 2
         self.screen.addstr(panel.y - 1, title_x, title_text, color | curses.A_BOLD)
-        
-        # Bordes laterales
-        for i in range(panel.height - 2):
-            self.screen.addstr(panel.y + i, panel.x, "│", color)
-            self.screen.addstr(panel.y + i, panel.x + panel.width - 1, "│", color)
-        
+
+        # Bordes laterales: una llamada C por lado en vez de una por fila
+        self.screen.vline(panel.y, panel.x, curses.ACS_VLINE | color, panel.height - 2)
+        self.screen.vline(panel.y, panel.x + panel.width - 1,
+                          curses.ACS_VLINE | color, panel.height - 2)
+
         # Borde inferior
-        self.screen.addstr(panel.y + panel.height - 2, panel.x, 
-                         "└" + "─" * (panel.width - 2) + "┘", color)
+        self.screen.addstr(panel.y + panel.height - 2, panel.x,
+                         panel._border_bottom, color)
     
     def draw_panel_content(self, panel: Panel):
         """Dibuja el contenido de un panel"""
         visible_items = panel.height - 3
-        
+
+        if panel._loading:
+            # Fila transitoria mientras el escaneo corre en segundo plano
+            blank = panel._blank_row
+            try:
+                self.screen.addstr(panel.y, panel.x + 1,
+                                   " Cargando...".ljust(panel.width - 2),
+                                   self._attr_loading)
+                for i in range(1, visible_items):
+                    self.screen.addstr(panel.y + i, panel.x + 1, blank,
+                                       self._attr_normal)
+            except curses.error:
+                pass
+            return
+
         for i in range(visible_items):
             item_index = panel.scroll_offset + i
             y_pos = panel.y + i
-            
+
             if item_index >= len(panel.items):
-                break
-            
-            item = panel.items[item_index]
-            is_selected = (item_index == panel.selected_index) and panel.is_active
-            
-            # Determinar color
-            if is_selected:
-                color = curses.color_pair(3) | curses.A_REVERSE
-            elif item.is_dir:
-                color = curses.color_pair(8)
-            elif item.is_nc:
-                color = curses.color_pair(4)
-            else:
-                color = curses.color_pair(6)
-            
-            # Formatear texto del item
-            name = item.name[:panel.width - 15]  # Truncar si es muy largo
-            size = item.format_size()
-            
-            # Rellenar línea
-            line = f" {name:<{panel.width-12}} {size:>8} "
-            line = line[:panel.width - 2]
-            line = line.ljust(panel.width - 2)
-            
-            try:
-                self.screen.addstr(y_pos, panel.x + 1, line, color)
-            except curses.error:
-                pass  # Ignorar errores de dibujo en los bordes
+                # Limpiar filas sobrantes (ya no hay clear() global por frame)
+                try:
+                    self.screen.addstr(y_pos, panel.x + 1, panel._blank_row,
+                                       self._attr_normal)
+                except curses.error:
+                    pass
+                continue
+
+            self._draw_panel_row(panel, item_index)
+
+    def _draw_panel_row(self, panel: Panel, item_index: int):
+        """Dibuja una única fila de un panel"""
+        y_pos = panel.y + (item_index - panel.scroll_offset)
+        item = panel.items[item_index]
+        is_selected = (item_index == panel.selected_index) and panel.is_active
+
+        # Determinar color
+        if is_selected:
+            color = self._attr_selected
+        elif item.is_dir:
+            color = self._attr_dir
+        elif item.is_nc:
+            color = self._attr_nc
+        else:
+            color = self._attr_normal
+
+        # Formatear la fila completa en una sola asignación
+        line = panel._row_fmt.format(item.name[:panel._trunc_w], item.format_size())
+
+        try:
+            self.screen.addstr(y_pos, panel.x + 1, line, color)
+        except curses.error:
+            pass  # Ignorar errores de dibujo en los bordes
+
+    def draw_active_marker(self, panel: Panel):
+        """Repinta solo lo que depende de is_active: borde, título y fila seleccionada"""
+        self.draw_panel_border(panel, panel._title)
+        if panel.items and not panel._loading:
+            self._draw_panel_row(panel, panel.selected_index)
     
     def draw_preview(self):
         """Dibuja el panel de vista previa"""
         # Borde del panel de vista previa
-        color = curses.color_pair(2)
-        
-        # Borde superior
-        self.screen.addstr(self.preview_panel.y - 1, self.preview_panel.x, 
-                         "┌" + "─" * (self.preview_panel.width - 2) + "┐", color)
-        
+        color = self._attr_inactive
+
+        # Borde superior (línea precomputada)
+        self.screen.addstr(self.preview_panel.y - 1, self.preview_panel.x,
+                         self.preview_panel._border_top, color)
+
         # Título
         title = " Vista Previa "
         title_x = self.preview_panel.x + (self.preview_panel.width - len(title)) // 2
         self.screen.addstr(self.preview_panel.y - 1, title_x, title, color | curses.A_BOLD)
-        
-        # Bordes laterales
-        for i in range(self.preview_panel.height - 2):
-            self.screen.addstr(self.preview_panel.y + i, self.preview_panel.x, "│", color)
-            self.screen.addstr(self.preview_panel.y + i, 
-                             self.preview_panel.x + self.preview_panel.width - 1, "│", color)
-        
+
+        # Bordes laterales: una llamada C por lado
+        self.screen.vline(self.preview_panel.y, self.preview_panel.x,
+                          curses.ACS_VLINE | color, self.preview_panel.height - 2)
+        self.screen.vline(self.preview_panel.y,
+                          self.preview_panel.x + self.preview_panel.width - 1,
+                          curses.ACS_VLINE | color, self.preview_panel.height - 2)
+
         # Borde inferior
-        self.screen.addstr(self.preview_panel.y + self.preview_panel.height - 2, 
-                         self.preview_panel.x, 
-                         "└" + "─" * (self.preview_panel.width - 2) + "┘", color)
-        
+        self.screen.addstr(self.preview_panel.y + self.preview_panel.height - 2,
+                         self.preview_panel.x,
+                         self.preview_panel._border_bottom, color)
+
+        # Limpiar el área de contenido antes de redibujar
+        blank = self.preview_panel._blank_row
+        for i in range(self.preview_panel.height - 3):
+            try:
+                self.screen.addstr(self.preview_panel.y + i, self.preview_panel.x + 1,
+                                   blank, self._attr_normal)
+            except curses.error:
+                pass
+
         # Contenido de la vista previa
         self.draw_preview_content()
     
@@ -434,83 +921,53 @@ class NCInterface:
         """Dibuja el contenido de la vista previa"""
         if not self.preview_panel.nc_info:
             return
-        
-        y_offset = 0
+
         max_lines = self.preview_panel.height - 3
-        
+
         if "error" in self.preview_panel.nc_info:
-            self.screen.addstr(self.preview_panel.y + y_offset, 
-                             self.preview_panel.x + 1, 
-                             "Error al leer archivo", 
-                             curses.color_pair(5))
+            error_text = self.preview_panel.nc_info["error"]
+            self.screen.addstr(self.preview_panel.y,
+                             self.preview_panel.x + 1,
+                             error_text[:self.preview_panel.width - 3],
+                             self._attr_error)
             return
-        
-        info = self.preview_panel.nc_info
-        lines = []
-        
-        # Información del archivo
-        if "file_size" in info:
-            size = info["file_size"]
-            size_str = f"{size/1024/1024:.1f} MB" if size > 1024*1024 else f"{size/1024:.1f} KB"
-            lines.append(f"Tamaño: {size_str}")
-        
-        # Dimensiones
-        if "dimensions" in info:
-            lines.append("Dimensiones:")
-            for name, dim in list(info["dimensions"].items())[:5]:
-                size_info = f"({len(dim)} elementos)" if hasattr(dim, '__len__') else f"({dim})"
-                lines.append(f"  {name}: {size_info}")
-        
-        # Variables
-        if "variables" in info:
-            lines.append("Variables:")
-            for var in info["variables"]:
-                lines.append(f"  {var}")
-        
-        # Atributos globales
-        if "global_attrs" in info:
-            lines.append("Atributos:")
-            for key, value in info["global_attrs"].items():
-                value_str = str(value)[:30] + "..." if len(str(value)) > 30 else str(value)
-                lines.append(f"  {key}: {value_str}")
-        
-        # Dibujar líneas
-        for i, line in enumerate(lines[:max_lines]):
+
+        # Las líneas ya vienen formateadas (y cacheadas) del análisis
+        for i, line in enumerate(self.preview_panel.lines[:max_lines]):
             try:
-                self.screen.addstr(self.preview_panel.y + i, 
-                                 self.preview_panel.x + 1, 
-                                 line[:self.preview_panel.width - 3], 
-                                 curses.color_pair(6))
+                self.screen.addstr(self.preview_panel.y + i,
+                                 self.preview_panel.x + 1,
+                                 line[:self.preview_panel.width - 3],
+                                 self._attr_normal)
             except curses.error:
                 pass
     
     def draw_header(self):
         """Dibuja el header con branding de Papiweb"""
-        height, width = self.screen.getmaxyx()
+        width = self._term_w
         
         # Limpiar línea superior
-        self.screen.addstr(0, 0, " " * width, curses.color_pair(1))
+        self.screen.addstr(0, 0, " " * width, self._attr_active)
         
         # Título principal
-        app_info = self.config.config.get("app_info", {})
-        title = f"NetCDF Commander v{app_info.get('version', '1.0.0')}"
-        branding = f"by {app_info.get('developer', 'Papiweb Desarrollos Informáticos')}"
+        title = f"NetCDF Commander v{self._version}"
+        branding = f"by {self._developer}"
         
         # Centrar título
         title_x = (width - len(title)) // 2
-        self.screen.addstr(0, title_x, title, curses.color_pair(10) | curses.A_BOLD)
+        self.screen.addstr(0, title_x, title, self._attr_header_title)
         
         # Branding a la derecha
         branding_x = width - len(branding) - 1
         if branding_x > title_x + len(title) + 2:
-            self.screen.addstr(0, branding_x, branding, curses.color_pair(9))
+            self.screen.addstr(0, branding_x, branding, self._attr_brand)
     
     def show_splash_screen(self):
         """Muestra pantalla de bienvenida con branding"""
-        if not self.config.config.get("interface", {}).get("show_splash", True):
+        if not self._show_splash:
             return
-        
-        height, width = self.screen.getmaxyx()
+
+        height, width = self._term_h, self._term_w
         
         # Crear ventana de splash
         splash_height = 20
@@ -519,7 +976,9 @@ class NCInterface:
         splash_x = (width - splash_width) // 2
         
         splash_win = curses.newwin(splash_height, splash_width, splash_y, splash_x)
-        splash_win.box('║', '═')
+        # box() con caracteres ACS por defecto: los multibyte no caben en
+        # un chtype y lanzan OverflowError
+        splash_win.box()
         
         # Arte ASCII del logo
         logo_lines = [
@@ -536,18 +995,17 @@ class NCInterface:
             "  ╚══════════════════════════════════════════════════════════════╝"
         ]
         
-        app_info = self.config.config.get("app_info", {})
         info_lines = [
             "",
-            f"         🔬 NetCDF Commander v{app_info.get('version', '1.0.0')} 🔬",
+            f"         🔬 NetCDF Commander v{self._version} 🔬",
             "",
             "    🚀 Manejador Avanzado de Archivos Científicos NetCDF",
             "    💻 Interfaz Tipo Norton Commander",
             "    🌐 Compatible con Recursos Compartidos Windows",
             "",
-            f"    📧 {app_info.get('email', 'mgenialive@gmail.com')}",
-            f"    🌍 {app_info.get('website', 'https://www.papiweb-desarrollos.github.io/papiweb.com')}",
-            f"    📍 {app_info.get('location', 'Beccar, Buenos Aires, Argentina')}",
+            f"    📧 {self._app_email}",
+            f"    🌍 {self._app_web}",
+            f"    📍 {self._app_location}",
             "",
             "    ⚡ Cargando interfaz... Presiona cualquier tecla ⚡"
         ]
@@ -587,47 +1045,165 @@ class NCInterface:
         splash_win.clear()
         splash_win.refresh()
         del splash_win
+
+    def draw_status_bar(self):
         """Dibuja la barra de estado"""
-        height, width = self.screen.getmaxyx()
-        
-        # Limpiar barra de estado
-        self.screen.addstr(height - 2, 0, " " * width, curses.color_pair(7))
-        self.screen.addstr(height - 1, 0, " " * width, curses.color_pair(7))
+        height, width = self._term_h, self._term_w
         
         # Información del panel activo
-        active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
+        active_panel = self._active_panel_ref
         path_info = f" {active_panel.current_path} "
-        
+
         # Información de montaje
         mount_info = " [MONTADO] " if self.mount_status else " [NO MONTADO] "
-        mount_color = curses.color_pair(4) if self.mount_status else curses.color_pair(5)
-        
+        mount_color = self._attr_nc if self.mount_status else self._attr_error
+
         try:
-            self.screen.addstr(height - 2, 0, path_info, curses.color_pair(7))
+            # Limpiar barra de estado (insstr no mueve el cursor: escribir
+            # la celda inferior derecha no lanza curses.error)
+            self.screen.insstr(height - 2, 0, " " * width, self._attr_status)
+            self.screen.insstr(height - 1, 0, " " * width, self._attr_status)
+
+            self.screen.addstr(height - 2, 0, path_info, self._attr_status)
             self.screen.addstr(height - 2, len(path_info), mount_info, mount_color)
-            
+
             # Branding en barra de estado
             papiweb_text = "© Papiweb Desarrollos"
             papiweb_x = width - len(papiweb_text) - len(self.status_bar.message) - 3
             if papiweb_x > len(path_info) + len(mount_info) + 2:
-                self.screen.addstr(height - 2, papiweb_x, papiweb_text, 
-                                 curses.color_pair(9))
-            
-            self.screen.addstr(height - 2, width - len(self.status_bar.message) - 1, 
-                             self.status_bar.message, curses.color_pair(7))
-            
+                self.screen.addstr(height - 2, papiweb_x, papiweb_text,
+                                 self._attr_brand)
+
+            self.screen.addstr(height - 2, width - len(self.status_bar.message) - 1,
+                             self.status_bar.message, self._attr_status)
+
             # Teclas de ayuda con branding
             help_with_branding = f"{self.status_bar.help_text} | Papiweb Dev"
-            self.screen.addstr(height - 1, 0, help_with_branding[:width-1], 
-                             curses.color_pair(7))
+            self.screen.addstr(height - 1, 0, help_with_branding[:width-1],
+                             self._attr_status)
         except curses.error:
             pass
     
+    def _drain_ui_events(self):
+        """Aplica los eventos pendientes de los hilos de fondo (sin bloquear)"""
+        while True:
+            try:
+                event, panel, items = self._ui_events.get_nowait()
+            except queue.Empty:
+                return
+
+            if event == 'panel_items':
+                panel.items = items
+                panel._loading = False
+                if panel.selected_index >= len(items):
+                    panel.selected_index = max(0, len(items) - 1)
+                region = 'left' if panel is self.left_panel else 'right'
+                self._mark_dirty(region, 'status')
+                self.update_preview()
+
+    def _mark_dirty(self, *regions):
+        """Marca regiones de la pantalla para redibujar en el próximo ciclo"""
+        for region in regions:
+            self._dirty[region] = True
+
+    def _draw_dirty(self):
+        """Redibuja solo las regiones marcadas como sucias"""
+        if self._dirty['header']:
+            self.draw_header()
+            self._dirty['header'] = False
+
+        if self._dirty['left']:
+            self.draw_panel_border(self.left_panel, self.left_panel._title)
+            self.draw_panel_content(self.left_panel)
+            self._dirty['left'] = False
+
+        if self._dirty['right']:
+            self.draw_panel_border(self.right_panel, self.right_panel._title)
+            self.draw_panel_content(self.right_panel)
+            self._dirty['right'] = False
+
+        if self._dirty['preview']:
+            self.draw_preview()
+            self._dirty['preview'] = False
+
+        if self._dirty['status']:
+            self.draw_status_bar()
+            self._dirty['status'] = False
+
+        self.screen.noutrefresh()
+        curses.doupdate()
+
+    def _on_key_up(self):
+        """Mueve la selección hacia arriba en el panel activo"""
+        active_panel = self._active_panel_ref
+        active_panel.move_up()
+        self.update_preview()
+        self._mark_dirty(self.active_panel, 'status')
+
+    def _on_key_down(self):
+        """Mueve la selección hacia abajo en el panel activo"""
+        active_panel = self._active_panel_ref
+        active_panel.move_down()
+        self.update_preview()
+        self._mark_dirty(self.active_panel, 'status')
+
+    def _on_switch_panel(self):
+        """Cambia el panel activo (Tab / flecha derecha)"""
+        if self._active_panel_ref is self.left_panel:
+            self._active_panel_ref = self.right_panel
+            self.left_panel.is_active = False
+            self.right_panel.is_active = True
+        else:
+            self._active_panel_ref = self.left_panel
+            self.right_panel.is_active = False
+            self.left_panel.is_active = True
+        self.update_preview()
+        self._refresh_active_markers()
+
+    def _on_focus_left(self):
+        """Activa el panel izquierdo"""
+        self._active_panel_ref = self.left_panel
+        self.left_panel.is_active = True
+        self.right_panel.is_active = False
+        self.update_preview()
+        self._refresh_active_markers()
+
+    def _refresh_active_markers(self):
+        """Actualiza los indicadores de panel activo sin repintar los listados"""
+        self.draw_active_marker(self.left_panel)
+        self.draw_active_marker(self.right_panel)
+        self.screen.noutrefresh()
+        curses.doupdate()
+        self._mark_dirty('status')
+
+    def _on_enter(self):
+        """Entra en el directorio o selecciona el archivo bajo el cursor"""
+        active_panel = self._active_panel_ref
+        result = active_panel.enter_selected()
+        if result and result.is_nc:
+            self.status_bar.set_message(f"Archivo NC seleccionado: {result.name}")
+        self.update_preview()
+        self._mark_dirty(self.active_panel, 'status')
+
     def update_preview(self):
+        """Programa la actualización de la vista previa (con debounce)"""
+        preview_key = (self.active_panel,
+                       self.left_panel.current_path, self.left_panel.selected_index,
+                       self.right_panel.current_path, self.right_panel.selected_index)
+        if preview_key == self._preview_key:
+            return  # La selección visible no cambió: no hay nada que refrescar
+
+        self._preview_key = preview_key
+        self._preview_pending = True
+        self._preview_deadline = time.monotonic() + 0.15
+
+    def _refresh_preview_now(self):
         """Actualiza la vista previa basada en el archivo seleccionado"""
-        active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
+        self._preview_pending = False
+        self._mark_dirty('preview')
+        active_panel = self._active_panel_ref
         selected = active_panel.get_selected_item()
-        
+
         if selected and not selected.is_dir and selected.is_nc:
             self.preview_panel.analyze_file(selected.path)
         else:
@@ -635,46 +1211,50 @@ class NCInterface:
     
     def handle_f2_analyze(self):
         """Maneja F2 - Analizar archivo NetCDF"""
-        active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
+        active_panel = self._active_panel_ref
         selected = active_panel.get_selected_item()
         
         if not selected or not selected.is_nc:
             self.status_bar.set_message("Selecciona un archivo .nc para analizar")
+            self._mark_dirty('status')
             return
         
         self.status_bar.set_message("Analizando archivo...")
         self.screen.refresh()
-        
-        # Analizar en un hilo separado para no bloquear la UI
+
+        # Analizar en el pool de I/O para no bloquear la UI
         def analyze_thread():
             try:
                 # Aquí iría la lógica de análisis completo
                 self.status_bar.set_message(f"Archivo analizado: {selected.name}")
             except Exception as e:
                 self.status_bar.set_message(f"Error: {str(e)}")
-        
-        thread = threading.Thread(target=analyze_thread)
-        thread.daemon = True
-        thread.start()
+
+        self._io_pool.submit(analyze_thread)
+        self._mark_dirty('status')
     
     def handle_f4_export(self):
         """Maneja F4 - Exportar datos"""
-        active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
+        active_panel = self._active_panel_ref
         selected = active_panel.get_selected_item()
         
         if not selected or not selected.is_nc:
             self.status_bar.set_message("Selecciona un archivo .nc para exportar")
+            self._mark_dirty('status')
             return
-        
+
         # Aquí iría un diálogo para seleccionar formato y destino
         self.status_bar.set_message("Exportando... (implementar diálogo)")
+        self._mark_dirty('status')
     
     def handle_f5_mount(self):
         """Maneja F5 - Montar/desmontar recurso Windows"""
         if self.mount_status:
-            # Desmontar
+            # Desmontar (sin shell intermedio: ni fork extra ni metacaracteres)
             try:
-                result = os.system(f"sudo umount {self.config.config['windows_mount_point']}")
+                result = subprocess.run(
+                    ["sudo", "umount", self._mount_point],
+                    capture_output=True).returncode
                 if result == 0:
                     self.mount_status = False
                     self.status_bar.set_message("Recurso desmontado")
@@ -687,17 +1267,23 @@ class NCInterface:
             self.status_bar.set_message("Montando recurso Windows...")
             # Aquí iría la lógica de montaje
             self.mount_status = True  # Simulado por ahora
+        self._mark_dirty('status')
     
     def run(self):
-        """Ejecuta la interfaz principal"""
-        self.screen = curses.initscr()
-        
+        """Ejecuta la interfaz principal (pantalla provista por curses.wrapper)"""
         try:
             # Configuración inicial de curses
             curses.noecho()
             curses.cbreak()
             curses.curs_set(0)  # Ocultar cursor
             self.screen.keypad(True)
+
+            # Acotar la espera de ESC: algunos libcurses esperan ~1s para
+            # decidir si el ESC es parte de una secuencia
+            try:
+                curses.set_escdelay(25)
+            except AttributeError:
+                pass  # Python < 3.9
             
             self.init_colors()
             self.setup_panels()
@@ -707,200 +1293,186 @@ class NCInterface:
             
             # Bucle principal
             while self.running:
-                # Limpiar pantalla
-                self.screen.clear()
-                
-                # Dibujar header con branding
-                self.draw_header()
-                
-                # Dibujar componentes
-                self.draw_panel_border(self.left_panel, f"Panel Izq - {os.path.basename(self.left_panel.current_path)}")
-                self.draw_panel_content(self.left_panel)
-                
-                self.draw_panel_border(self.right_panel, f"Panel Der - {os.path.basename(self.right_panel.current_path)}")
-                self.draw_panel_content(self.right_panel)
-                
-                self.draw_preview()
-                self.draw_status_bar()
-                
-                # Actualizar pantalla
-                self.screen.refresh()
-                
-                # Procesar input
-                key = self.screen.getch()
-                
-                # Navegación
-                if key == curses.KEY_UP:
-                    active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
-                    active_panel.move_up()
-                    self.update_preview()
-                    
-                elif key == curses.KEY_DOWN:
-                    active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
-                    active_panel.move_down()
-                    self.update_preview()
-                    
-                elif key == ord('\t') or key == curses.KEY_RIGHT:
-                    # Cambiar panel activo
-                    if self.active_panel == 'left':
-                        self.active_panel = 'right'
-                        self.left_panel.is_active = False
-                        self.right_panel.is_active = True
-                    else:
-                        self.active_panel = 'left'
-                        self.right_panel.is_active = False
-                        self.left_panel.is_active = True
-                    self.update_preview()
-                    
-                elif key == curses.KEY_LEFT:
-                    # Cambiar panel activo (izquierda)
-                    self.active_panel = 'left'
-                    self.left_panel.is_active = True
-                    self.right_panel.is_active = False
-                    self.update_preview()
-                    
-                elif key == ord('\n') or key == curses.KEY_ENTER:
-                    # Entrar en directorio o seleccionar archivo
-                    active_panel = self.left_panel if self.active_panel == 'left' else self.right_panel
-                    result = active_panel.enter_selected()
-                    if result and result.is_nc:
-                        self.status_bar.set_message(f"Archivo NC seleccionado: {result.name}")
-                    self.update_preview()
-                
-                # Teclas de función
-                elif key == curses.KEY_F1:
-                    self.show_help()
-                elif key == curses.KEY_F2:
-                    self.handle_f2_analyze()
-                elif key == curses.KEY_F4:
-                    self.handle_f4_export()
-                elif key == curses.KEY_F5:
-                    self.handle_f5_mount()
-                elif key == curses.KEY_F10 or key == ord('q'):
-                    self.running = False
-                
-                # Tecla ESC
-                elif key == 27:
+                # Aplicar resultados de los hilos de fondo
+                self._drain_ui_events()
+
+                # Redibujar solo las regiones invalidadas
+                self._draw_dirty()
+
+                # Timeout adaptativo: getch bloquea cuando no hay trabajo
+                # pendiente; solo se pollea (50ms) mientras hay un debounce
+                # de vista previa o un refresco de panel en vuelo
+                if (self._preview_pending
+                        or self.left_panel._loading or self.right_panel._loading):
+                    self.screen.timeout(50)
+                else:
+                    self.screen.timeout(-1)
+
+                # Procesar input (str para imprimibles/ESC, int para KEY_*)
+                try:
+                    key = self.screen.get_wch()
+                except curses.error:
+                    key = -1  # Timeout sin tecla
+
+                # Sin tecla pendiente: momento de materializar la vista previa
+                if key == -1:
+                    if self._preview_pending and time.monotonic() >= self._preview_deadline:
+                        self._refresh_preview_now()
+                    continue
+
+                if key == curses.KEY_RESIZE:
+                    self._handle_resize()
+                    continue
+
+                # Salida (F10 / q / ESC)
+                if key in self._quit_keys:
                     self.running = False
+                    continue
+
+                # Despacho O(1) al handler correspondiente
+                handler = self._key_handlers.get(key)
+                if handler:
+                    handler()
         
         finally:
-            # Limpiar curses
-            curses.endwin()
+            # Apagar el pool de I/O y cerrar handles NetCDF
+            # (curses.wrapper se encarga de restaurar el terminal)
+            self._shutdown_io_pool()
+            _nc_pool.close_all()
     
     def show_help(self):
         """Muestra la ventana de ayuda con branding"""
-        height, width = self.screen.getmaxyx()
-        
-        # Crear ventana de ayuda
         help_height = 22
         help_width = 70
-        help_y = (height - help_height) // 2
-        help_x = (width - help_width) // 2
-        
-        help_win = curses.newwin(help_height, help_width, help_y, help_x)
-        help_win.box('║', '═')
-        
-        app_info = self.config.config.get("app_info", {})
-        
-        help_lines = [
-            f" {app_info.get('name', 'NetCDF Commander')} - AYUDA ",
-            f" {app_info.get('developer', 'Papiweb Desarrollos Informáticos')} ",
-            "═" * 66,
-            "",
-            "🎯 NAVEGACIÓN:",
-            "  ↑/↓        - Mover selección en panel activo",
-            "  ←/→/Tab    - Cambiar entre paneles",
-            "  Enter      - Entrar en directorio o seleccionar archivo",
-            "",
-            "⚡ TECLAS DE FUNCIÓN:",
-            "  F1         - Mostrar esta ayuda",
-            "  F2         - Analizar archivo NetCDF seleccionado",
-            "  F3         - Ver detalles del archivo",
-            "  F4         - Exportar datos a CSV/JSON/TXT",
-            "  F5         - Montar/desmontar recurso Windows",
-            "  F6         - Copiar archivo entre paneles",
-            "  F9         - Configuración del sistema",
-            "  F10/Q/Esc  - Salir de la aplicación",
-            "",
-            "📊 FUNCIONES NetCDF:",
-            "  • Vista previa automática de metadatos",
-            "  • Análisis de dimensiones y variables",
-            "  • Exportación a múltiples formatos",
-            "",
-            f"📧 Soporte: {app_info.get('email', 'info@papiweb.com.ar')}",
-            f"🌍 Web: {app_info.get('website', 'www.papiweb.com.ar')}",
-            "",
-            "        ⌨️  Presiona cualquier tecla para continuar  ⌨️"
-        ]
-        
-        for i, line in enumerate(help_lines):
-            if i < help_height - 2:
-                if i == 0:  # Título
-                    text_x = (help_width - len(line)) // 2
-                    help_win.addstr(i + 1, text_x, line[:help_width - 4], 
-                                  curses.color_pair(10) | curses.A_BOLD)
-                elif i == 1:  # Desarrollador
-                    text_x = (help_width - len(line)) // 2
-                    help_win.addstr(i + 1, text_x, line[:help_width - 4], 
-                                  curses.color_pair(9))
-                elif "🎯" in line or "⚡" in line or "📊" in line:
-                    help_win.addstr(i + 1, 2, line[:help_width - 4], 
-                                  curses.color_pair(4) | curses.A_BOLD)
-                elif "📧" in line or "🌍" in line:
-                    help_win.addstr(i + 1, 2, line[:help_width - 4], 
-                                  curses.color_pair(9))
-                elif "⌨️" in line:
-                    text_x = (help_width - len(line)) // 2
-                    help_win.addstr(i + 1, text_x, line[:help_width - 4], 
-                                  curses.color_pair(3) | curses.A_BLINK)
+
+        # Ventana y posiciones calculadas una sola vez; solo un resize
+        # obliga a recrearlas
+        if self._help_win is None:
+            help_y = (self._term_h - help_height) // 2
+            help_x = (self._term_w - help_width) // 2
+            self._help_win = curses.newwin(help_height, help_width, help_y, help_x)
+            self._help_panel = curses.panel.new_panel(self._help_win)
+            self._help_panel.hide()
+
+            # Truncado, centrado y palabra de atributos resueltos de antemano;
+            # las líneas consecutivas con el mismo atributo se unen con '\n'
+            # (sangradas con espacios) para emitir un solo addstr por tramo
+            rows = []
+            for i, (line, pair, attrs, center) in enumerate(self._help_render):
+                if i < help_height - 2:
+                    text_x = (help_width - len(line)) // 2 if center else 2
+                    rows.append((i + 1, " " * text_x + line[:help_width - 4],
+                                 curses.color_pair(pair) | attrs))
+
+            self._help_layout = []
+            for y, text, attr in rows:
+                if self._help_layout and self._help_layout[-1][2] == attr \
+                        and self._help_layout[-1][0] + self._help_layout[-1][3] == y:
+                    prev_y, prev_text, _, count = self._help_layout[-1]
+                    self._help_layout[-1] = (prev_y, prev_text + "\n" + text,
+                                             attr, count + 1)
                 else:
-                    help_win.addstr(i + 1, 2, line[:help_width - 4], 
-                                  curses.color_pair(6))
-        
-        help_win.refresh()
+                    self._help_layout.append((y, text, attr, 1))
+
+        help_win = self._help_win
+        help_win.erase()
+
+        for y, block, attr, _count in self._help_layout:
+            help_win.addstr(y, 0, block, attr)
+
+        # El borde se dibuja al final: el '\n' de los bloques limpia hasta
+        # el fin de línea y pisaría los laterales. ACS por defecto: los
+        # caracteres multibyte no caben en un chtype
+        help_win.box()
+
+        # El stack de paneles de ncurses repinta solo las celdas tapadas
+        self._help_panel.show()
+        curses.panel.update_panels()
+        curses.doupdate()
+
         help_win.getch()  # Esperar tecla
-        help_win.clear()
-        help_win.refresh()
+
+        # Descartar la entrada acumulada mientras la ayuda estaba abierta
+        # (pegados/teclas repetidas): así el bucle principal no despacha
+        # pulsaciones viejas contra un estado que ya no existe
+        self.screen.nodelay(True)
+        while self.screen.getch() != -1:
+            pass
+        self.screen.nodelay(False)
+
+        self._help_panel.hide()
+        curses.panel.update_panels()
+        curses.doupdate()
+
+# Banners precompuestos: un solo write/syscall en vez de un print por línea
+BANNER = """\
+╔══════════════════════════════════════════════════════════════╗
+║                  PAPIWEB DESARROLLOS INFORMÁTICOS            ║
+║                                                              ║
+║              🔬 NetCDF Commander v1.0.0 🔬                   ║
+║        Manejador Avanzado de Archivos Científicos           ║
+║                                                              ║
+║    📧 mgenialive@gmail.com                                   ║
+║    🌍 https://www.papiweb-desarrollos.github.io/papiweb      ║
+║    📍 Beccar, Buenos Aires, Argentina                       ║
+║                                                              ║
+║           Iniciando interfaz Norton Commander...            ║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+
+FAREWELL = """
+╔══════════════════════════════════════════════════════════════╗
+║        Gracias por usar NetCDF Commander                    ║
+║              by Papiweb Desarrollos Informáticos            ║
+║                                                              ║
+║    Para soporte técnico: mgenialive@gmail.com                ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+CANCELLED_MSG = """
+
+🚫 Operación cancelada por el usuario
+👋 ¡Hasta la próxima! - Papiweb Desarrollos
+"""
+
+def _print_banner(full: str, short: str):
+    """Escribe el banner completo solo en un TTY interactivo
+
+    En pipes/CI (o con NETCDF_QUIET=1) sale una versión de una línea:
+    curses va a limpiar la pantalla de inmediato de todos modos.
+    """
+    if sys.stdout.isatty() and os.environ.get("NETCDF_QUIET") != "1":
+        sys.stdout.write(full)
+    else:
+        sys.stdout.write(short)
+    sys.stdout.flush()
+
+def _run(stdscr):
+    """Cuerpo de la aplicación bajo curses.wrapper"""
+    config = NetCDFConfig()
+    NCInterface(config, stdscr).run()
 
 def main():
     """Función principal - Papiweb Desarrollos Informáticos"""
     try:
         # Mostrar información del desarrollador al inicio
-        print("╔══════════════════════════════════════════════════════════════╗")
-        print("║                  PAPIWEB DESARROLLOS INFORMÁTICOS            ║")
-        print("║                                                              ║")
-        print("║              🔬 NetCDF Commander v1.0.0 🔬                   ║")
-        print("║        Manejador Avanzado de Archivos Científicos           ║")
-        print("║                                                              ║")
-        print("║    📧 mgenialive@gmail.com                                   ║")
-        print("║    🌍 https://www.papiweb-desarrollos.github.io/papiweb      ║")
-        print("║    📍 Beccar, Buenos Aires, Argentina                       ║")
-        print("║                                                              ║")
-        print("║           Iniciando interfaz Norton Commander...            ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        print()
-        
-        config = NetCDFConfig()
-        interface = NCInterface(config)
-        interface.run()
-        
+        _print_banner(BANNER, "NetCDF Commander v1.0.0 - Papiweb Desarrollos Informáticos\n")
+
+        # wrapper inicializa curses y restaura el terminal incluso ante crash
+        curses.wrapper(_run)
+
         # Mensaje de despedida
-        print("\n╔══════════════════════════════════════════════════════════════╗")
-        print("║        Gracias por usar NetCDF Commander                    ║")
-        print("║              by Papiweb Desarrollos Informáticos            ║")
-        print("║                                                              ║")
-        print("║    Para soporte técnico: mgenialive@gmail.com                ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        
+        _print_banner(FAREWELL, "NetCDF Commander: sesión finalizada\n")
+
     except KeyboardInterrupt:
-        print("\n\n🚫 Operación cancelada por el usuario")
-        print("👋 ¡Hasta la próxima! - Papiweb Desarrollos")
+        sys.stdout.write(CANCELLED_MSG)
+        sys.stdout.flush()
     except Exception as e:
-        if 'interface' in locals():
-            curses.endwin()
-        print(f"\n❌ Error crítico: {e}")
-        print("📧 Reporta este error a: mgenialive@gmail.com")
-        print("🔧 Papiweb Desarrollos Informáticos - Soporte Técnico")
+        sys.stdout.write(f"\n❌ Error crítico: {e}\n"
+                         "📧 Reporta este error a: mgenialive@gmail.com\n"
+                         "🔧 Papiweb Desarrollos Informáticos - Soporte Técnico\n")
+        sys.stdout.flush()
         sys.exit(1)
 
 if __name__ == "__main__":